@@ -51,8 +51,8 @@ class AgentSpecTransformer:
             
             input_schema = ToolInputSchema(
                 type=input_schema_data.get("type", "object"),
-                properties=input_schema_data.get("properties", {}),
-                required=input_schema_data.get("required", [])
+                properties=input_schema_data.get("properties") or {},
+                required=input_schema_data.get("required") or []
             )
             
             agent_spec = AgentSpecification(
@@ -92,8 +92,8 @@ class AgentSpecTransformer:
                 
                 input_schema = ToolInputSchema(
                     type=input_schema_data.get("type", "object"),
-                    properties=input_schema_data.get("properties", {}),
-                    required=input_schema_data.get("required", [])
+                    properties=input_schema_data.get("properties") or {},
+                    required=input_schema_data.get("required") or []
                 )
                 
                 tool_config = AgentToolConfig(
@@ -111,8 +111,8 @@ class AgentSpecTransformer:
                 
                 input_schema = ToolInputSchema(
                     type=input_schema_data.get("type", "object"),
-                    properties=input_schema_data.get("properties", {}),
-                    required=input_schema_data.get("required", [])
+                    properties=input_schema_data.get("properties") or {},
+                    required=input_schema_data.get("required") or []
                 )
                 
                 tool_config = AgentToolConfig(
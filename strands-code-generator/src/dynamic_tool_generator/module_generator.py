@@ -2,9 +2,8 @@
 Python module generator - creates Python tool modules from specifications
 """
 import os
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Final
 import logging
 
 from ..models.tool_spec import ToolSpecification, ToolType
@@ -12,6 +11,19 @@ from .template_manager import ToolTemplateManager
 
 logger = logging.getLogger(__name__)
 
+# Required-field count above which generated validation uses a set difference
+_MAX_PER_FIELD_CHECKS: Final[int] = 3
+
+# Conversation policy appended to every generated agent's system prompt
+_AGENT_POLICY_SUFFIX: Final[str] = """Do not use the speak_to_user and ask_user tool together, use only one of them, use ask_user if both were to be used, as using both will cause latency issues if used at the same time or one after the other immediately. After speech is done, do not speak again and again, the user will say something if required. Only ask_user means a response is mandatory. You communicate with the user only through conversation.
+When the user indicates they are done, says no help is needed, or the goal has been completed,
+END the conversation by ending the turn.
+
+After saying a polite closing line once (if needed), do not speak again or repeat yourself. Just stop and end the turn (stop reason)
+Never continue saying goodbye or asking if more help is needed repeatedly.
+Do not reinitiate conversation after the user says goodbye, thanks, or declines further help. End the turn and STOP responding immediately.
+"""
+
 
 class PythonModuleGenerator:
     """Generates Python tool modules from tool specifications"""
@@ -104,8 +116,7 @@ class PythonModuleGenerator:
             module_filename = f"{tool_spec.name}.py"
             module_path = output_path / module_filename
             
-            with open(module_path, 'w', encoding='utf-8') as f:
-                f.write(module_content)
+            module_path.write_bytes(module_content.encode('utf-8'))
             
             logger.info(f"Generated tool module: {module_path}")
             return module_path
@@ -116,14 +127,12 @@ class PythonModuleGenerator:
     
     def _generate_module_content(self, tool_spec: ToolSpecification) -> str:
         """Generate the complete module content for a tool"""
-        template = self.template_manager.get_template(tool_spec.tool_type)
-        
         # Prepare template variables
         template_vars = {
             'tool_name': tool_spec.name,
             'tool_description': tool_spec.description,
-            'tool_spec_json': json.dumps(tool_spec.to_dict(), indent=4),
-            'input_schema_json': json.dumps(tool_spec.input_schema.__dict__, indent=4)
+            'tool_spec_json': tool_spec.json_str,
+            'input_schema_json': tool_spec.input_schema.json_str
         }
         
         # For frontend actions and agent tools, generate function signature and documentation
@@ -136,32 +145,47 @@ class PythonModuleGenerator:
             template_vars['validation_code'] = self._generate_validation_code(tool_spec)
             template_vars['execution_code'] = self._generate_execution_code(tool_spec)
         
-        # Replace template variables
-        return template.format(**template_vars)
+        # Render the template with the collected variables
+        return self.template_manager.render(tool_spec.tool_type, template_vars)
     
     def _generate_validation_code(self, tool_spec: ToolSpecification) -> str:
         """Generate input validation code for the tool"""
         validation_lines = []
+        required = tool_spec.input_schema.required
         
         # For frontend actions, keep validation simple
         if tool_spec.tool_type == ToolType.FRONTEND_ACTION:
-            if tool_spec.input_schema.required:
+            if required:
                 validation_lines.append("    # Validate required parameters")
-                for required_field in tool_spec.input_schema.required:
-                    validation_lines.append(f"    if '{required_field}' not in tool_input:")
-                    validation_lines.append(f"        raise ValueError('Required parameter \"{required_field}\" is missing')")
+                validation_lines.extend(self._generate_required_checks(required, 'parameter'))
             else:
                 validation_lines.append("    # No validation required")
         else:
             # More complex validation for other tool types
             validation_lines.append("    # Validate required fields")
-            if tool_spec.input_schema.required:
-                for required_field in tool_spec.input_schema.required:
-                    validation_lines.append(f"    if '{required_field}' not in tool_input:")
-                    validation_lines.append(f"        raise ValueError('Required field \"{required_field}\" is missing')")
+            if required:
+                validation_lines.extend(self._generate_required_checks(required, 'field'))
         
         return "\n".join(validation_lines)
     
+    def _generate_required_checks(self, required: list, label: str) -> list:
+        """Generate code lines checking that all required keys are present in tool_input"""
+        # A single set difference beats per-field lookups once there are several fields
+        if len(required) > _MAX_PER_FIELD_CHECKS:
+            required_items = ', '.join(repr(required_field) for required_field in required)
+            return [
+                f"    _required = frozenset({{{required_items}}})",
+                "    _missing = _required - tool_input.keys()",
+                "    if _missing:",
+                f"        raise ValueError(f'Missing required {label}s: {{sorted(_missing)}}')"
+            ]
+        
+        lines = []
+        for required_field in required:
+            lines.append(f"    if '{required_field}' not in tool_input:")
+            lines.append(f"        raise ValueError('Required {label} \"{required_field}\" is missing')")
+        return lines
+    
     def _generate_execution_code(self, tool_spec: ToolSpecification) -> str:
         """Generate execution code based on tool type"""
         if tool_spec.tool_type == ToolType.FRONTEND_ACTION:
@@ -210,43 +234,40 @@ class PythonModuleGenerator:
     def _generate_function_signature_vars(self, tool_spec: ToolSpecification) -> dict:
         """Generate function signature variables for @tool decorator approach"""
         properties = tool_spec.input_schema.properties or {}
-        required_fields = tool_spec.input_schema.required or []
+        required_fields = set(tool_spec.input_schema.required or [])
         
-        # Generate function parameters
-        params = []
-        param_dict_items = []
-        args_docs = []
-        type_imports = set()
+        # Keep only dict definitions and resolve each Python type once
+        to_python_type = self._json_type_to_python_type
+        entries = [
+            (param_name, param_def, to_python_type(param_def.get('type', 'string')))
+            for param_name, param_def in properties.items()
+            if isinstance(param_def, dict)
+        ]
         
-        for param_name, param_def in properties.items():
-            if isinstance(param_def, dict):
-                # Determine Python type from JSON schema type
-                param_type = self._json_type_to_python_type(param_def.get('type', 'string'))
-                
-                # Add type import if needed
-                if param_type in ['List[Any]', 'Dict[str, Any]']:
-                    type_imports.add('List')
-                    type_imports.add('Dict')
-                
-                # Handle optional parameters
-                if param_name not in required_fields:
-                    if 'default' in param_def:
-                        default_value = repr(param_def['default'])
-                    else:
-                        default_value = 'None'
-                        param_type = f'Optional[{param_type}]'
-                        type_imports.add('Optional')
-                    
-                    params.append(f'{param_name}: {param_type} = {default_value}')
-                else:
-                    params.append(f'{param_name}: {param_type}')
-                
-                # Add to parameter dictionary
-                param_dict_items.append(f'"{param_name}": {param_name}')
-                
-                # Add to args documentation
-                description = param_def.get('description', f'The {param_name} parameter')
-                args_docs.append(f'        {param_name}: {description}')
+        # Generate function parameters (optional ones without a default become Optional[...] = None)
+        params = [
+            f'{param_name}: {param_type}' if param_name in required_fields
+            else f'{param_name}: {param_type} = {param_def["default"]!r}' if 'default' in param_def
+            else f'{param_name}: Optional[{param_type}] = None'
+            for param_name, param_def, param_type in entries
+        ]
+        
+        # Parameter dictionary items and args documentation
+        param_dict_items = [f'"{param_name}": {param_name}' for param_name, _, _ in entries]
+        args_docs = [
+            f"        {param_name}: {param_def.get('description', f'The {param_name} parameter')}"
+            for param_name, param_def, _ in entries
+        ]
+        
+        # Collect typing imports needed by the signature
+        type_imports = set()
+        if any(param_type in ('List[Any]', 'Dict[str, Any]') for _, _, param_type in entries):
+            type_imports.update(('List', 'Dict'))
+        if any(
+            param_name not in required_fields and 'default' not in param_def
+            for param_name, param_def, _ in entries
+        ):
+            type_imports.add('Optional')
         
         # Create function signature
         function_signature = ', '.join(params) if params else ''
@@ -286,14 +307,10 @@ class PythonModuleGenerator:
         """Generate variables for agent tool template"""
         # Get agent-specific data from frontend_data
         frontend_data = tool_spec.frontend_data or {}
-        system_prompt = frontend_data.get('system_prompt', f'You are a specialized {tool_spec.name} agent.') + """Do not use the speak_to_user and ask_user tool together, use only one of them, use ask_user if both were to be used, as using both will cause latency issues if used at the same time or one after the other immediately. After speech is done, do not speak again and again, the user will say something if required. Only ask_user means a response is mandatory. You communicate with the user only through conversation.
-When the user indicates they are done, says no help is needed, or the goal has been completed,
-END the conversation by ending the turn.
-
-After saying a polite closing line once (if needed), do not speak again or repeat yourself. Just stop and end the turn (stop reason)
-Never continue saying goodbye or asking if more help is needed repeatedly.
-Do not reinitiate conversation after the user says goodbye, thanks, or declines further help. End the turn and STOP responding immediately.
-"""
+        tool_name = tool_spec.name
+        system_prompt = (
+            frontend_data.get('system_prompt') or f'You are a specialized {tool_name} agent.'
+        ) + _AGENT_POLICY_SUFFIX
         builtin_tools = frontend_data.get('builtin_tools', [])
         generated_tools = frontend_data.get('tools', [])
         agent_tools = frontend_data.get('agent_tools', [])  # Other agents this agent can call
@@ -345,9 +362,9 @@ Do not reinitiate conversation after the user says goodbye, thanks, or declines
         
         # Return all template variables
         return {
-            'tool_name': tool_spec.name,
+            'tool_name': tool_name,
             'tool_description': tool_spec.description,
-            'tool_name_upper': tool_spec.name.upper(),
+            'tool_name_upper': tool_name.upper(),
             'system_prompt': system_prompt,
             'builtin_imports': builtin_imports,
             'generated_imports': generated_imports,
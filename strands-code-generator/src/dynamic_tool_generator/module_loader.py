@@ -1,18 +1,26 @@
 """
 Dynamic module loader - loads and manages generated tool modules at runtime
 """
+import os
 import sys
 import importlib
 import importlib.util
+import py_compile
 from pathlib import Path
-from types import ModuleType
-from typing import Dict, Any, Optional, Callable
+from types import ModuleType, MappingProxyType
+from typing import Dict, Any, Optional, Callable, Mapping
 import logging
 import time
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized absolute-path resolutions kept by each loader
+_KEY_CACHE_SIZE = 1024
+
+# .pyc header flag bits (PEP 552): hash-based, and checked against the source on import
+_PYC_CHECKED_HASH_FLAGS = 0b11
+
 
 class DynamicModuleLoader:
     """Loads and manages dynamically generated tool modules"""
@@ -22,6 +30,8 @@ class DynamicModuleLoader:
         self.module_cache: Dict[str, Dict[str, Any]] = {}
         self.module_timestamps: Dict[str, float] = {}
         self.module_hashes: Dict[str, str] = {}
+        self._key_cache: Dict[str, str] = {}
+        self._loaded_view = MappingProxyType(self.loaded_modules)
     
     def load_tool_module(self, module_path: Path) -> ModuleType:
         """
@@ -38,13 +48,12 @@ class DynamicModuleLoader:
             FileNotFoundError: If module file doesn't exist
         """
         try:
-            module_path = Path(module_path).resolve()
+            module_key = self._key(module_path)
+            module_path = Path(module_key)
             
             if not module_path.exists():
                 raise FileNotFoundError(f"Module file not found: {module_path}")
             
-            module_key = str(module_path)
-            
             # Check if module needs reloading
             if self._should_reload_module(module_path, module_key):
                 logger.info(f"Loading/reloading module: {module_path}")
@@ -120,12 +129,13 @@ class DynamicModuleLoader:
         Returns:
             True if module was unloaded, False if not found
         """
-        module_key = str(Path(module_path).resolve())
+        module_key = self._key(module_path)
         
         if module_key in self.loaded_modules:
             # Remove from sys.modules if present
             module = self.loaded_modules[module_key]
-            if hasattr(module, '__name__') and module.__name__ in sys.modules:
+            # Module names are stable per file stem, so only drop our own entry
+            if sys.modules.get(getattr(module, '__name__', None)) is module:
                 del sys.modules[module.__name__]
             
             # Remove from our caches
@@ -133,6 +143,8 @@ class DynamicModuleLoader:
             self.module_cache.pop(module_key, None)
             self.module_timestamps.pop(module_key, None)
             self.module_hashes.pop(module_key, None)
+            for raw_path in [raw for raw, key in self._key_cache.items() if key == module_key]:
+                del self._key_cache[raw_path]
             
             logger.info(f"Unloaded module: {module_path}")
             return True
@@ -149,8 +161,6 @@ class DynamicModuleLoader:
         Returns:
             Reloaded module object
         """
-        module_key = str(Path(module_path).resolve())
-        
         # Remove from cache to force reload
         self.unload_module(module_path)
         
@@ -162,13 +172,35 @@ class DynamicModuleLoader:
         for module_key in list(self.loaded_modules.keys()):
             module_path = Path(module_key)
             self.unload_module(module_path)
+        self._key_cache.clear()
         
         logger.info("Cleared all module cache")
     
     def get_loaded_modules(self) -> Dict[str, ModuleType]:
-        """Get dictionary of all loaded modules"""
+        """Get a snapshot copy of all loaded modules"""
         return self.loaded_modules.copy()
     
+    @property
+    def loaded_modules_view(self) -> Mapping[str, ModuleType]:
+        """Read-only live view of loaded modules, for iteration without copying"""
+        return self._loaded_view
+    
+    def _key(self, module_path: Path) -> str:
+        """Get the cache key for a module path, memoizing resolution of absolute paths"""
+        raw_path = os.fspath(module_path)
+        if not os.path.isabs(raw_path):
+            # Relative paths depend on the current working directory, so resolve every time
+            return str(Path(raw_path).resolve())
+        
+        module_key = self._key_cache.get(raw_path)
+        if module_key is None:
+            module_key = str(Path(raw_path).resolve())
+            if len(self._key_cache) >= _KEY_CACHE_SIZE:
+                # Evict the oldest memoized path
+                del self._key_cache[next(iter(self._key_cache))]
+            self._key_cache[raw_path] = module_key
+        return module_key
+    
     def _should_reload_module(self, module_path: Path, module_key: str) -> bool:
         """Check if module should be reloaded based on file changes"""
         # If not in cache, definitely load
@@ -200,7 +232,9 @@ class DynamicModuleLoader:
     
     def _load_module_from_file(self, module_path: Path) -> ModuleType:
         """Load module from file using importlib"""
-        module_name = f"dynamic_tool_{module_path.stem}_{int(time.time())}"
+        # Stable name so repeated loads reuse the __pycache__ bytecode
+        module_name = f"dynamic_tool_{module_path.stem}"
+        self._ensure_bytecode_cache(module_path)
         
         # Create module spec
         spec = importlib.util.spec_from_file_location(module_name, module_path)
@@ -211,17 +245,59 @@ class DynamicModuleLoader:
         module = importlib.util.module_from_spec(spec)
         
         # Add to sys.modules before execution to handle circular imports
+        previous_module = sys.modules.get(module_name)
         sys.modules[module_name] = module
         
         try:
             spec.loader.exec_module(module)
         except Exception as e:
-            # Clean up on failure
-            sys.modules.pop(module_name, None)
+            # Clean up on failure, keeping any previously loaded version
+            if previous_module is not None:
+                sys.modules[module_name] = previous_module
+            else:
+                sys.modules.pop(module_name, None)
             raise ImportError(f"Error executing module {module_path}: {str(e)}")
         
         return module
     
+    def _ensure_bytecode_cache(self, module_path: Path) -> None:
+        """
+        Make sure the module's .pyc is hash-checked against its source
+        
+        Generated modules are rewritten in place, often within the same second
+        and with the same size, which the default timestamp-based .pyc check
+        cannot detect. A hash-checked .pyc is validated against the source
+        content by the import system and stays hash-based when it is refreshed,
+        so any other .pyc (e.g. from a plain import) is replaced with one.
+        """
+        cache_path = importlib.util.cache_from_source(str(module_path))
+        try:
+            with open(cache_path, 'rb') as f:
+                header = f.read(8)
+        except OSError:
+            header = None
+        
+        if header is None:
+            # Respect the interpreter setting; with no .pyc there is nothing stale to read
+            if sys.dont_write_bytecode:
+                return
+        elif (
+            header[:4] == importlib.util.MAGIC_NUMBER
+            and int.from_bytes(header[4:8], 'little') & _PYC_CHECKED_HASH_FLAGS == _PYC_CHECKED_HASH_FLAGS
+        ):
+            return
+        
+        try:
+            py_compile.compile(
+                str(module_path),
+                cfile=cache_path,
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+            )
+        except (py_compile.PyCompileError, OSError) as e:
+            # Let the regular import path report the error or compile in memory
+            logger.debug(f"Could not precompile {module_path}: {e}")
+    
     def _cache_module(self, module_key: str, module: ModuleType, module_path: Path):
         """Cache module with metadata"""
         self.loaded_modules[module_key] = module
@@ -239,9 +315,12 @@ class DynamicModuleLoader:
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file content"""
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-                return hashlib.sha256(content).hexdigest()
+            with open(file_path, 'rb', buffering=0) as f:
+                # hashlib.file_digest (3.11+) streams the file through a C buffer
+                # instead of materializing the whole content as bytes
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                return hashlib.sha256(f.read()).hexdigest()
         except Exception as e:
             logger.warning(f"Error calculating hash for {file_path}: {e}")
             return ""
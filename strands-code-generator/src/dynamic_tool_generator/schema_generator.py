@@ -6,25 +6,93 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Python and JSON type names normalized to JSON schema types
+_TYPE_MAPPING = {
+    "str": "string",
+    "string": "string",
+    "int": "integer",
+    "integer": "integer",
+    "float": "number",
+    "number": "number",
+    "bool": "boolean",
+    "boolean": "boolean",
+    "list": "array",
+    "array": "array",
+    "dict": "object",
+    "object": "object"
+}
+
+# Exact Python value types to inferred JSON schema types; bool precedes int for the
+# isinstance fallback since bool is an int subclass. None is inferred as "string".
+_PY_TO_JSON = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    list: "array",
+    dict: "object",
+    str: "string",
+    type(None): "string"
+}
+
+# JSON schema types accepted by validate_schema
+_VALID_TYPES = frozenset({"string", "integer", "number", "boolean", "array", "object", "null"})
+
+
+def _apply_string_constraints(
+    schema: Dict[str, Any], prop_def: Dict[str, Any], generator: "JSONSchemaGenerator"
+) -> None:
+    """Copy string length and pattern constraints"""
+    if "minLength" in prop_def:
+        schema["minLength"] = int(prop_def["minLength"])
+    if "maxLength" in prop_def:
+        schema["maxLength"] = int(prop_def["maxLength"])
+    if "pattern" in prop_def:
+        schema["pattern"] = str(prop_def["pattern"])
+
+
+def _apply_numeric_constraints(
+    schema: Dict[str, Any], prop_def: Dict[str, Any], generator: "JSONSchemaGenerator"
+) -> None:
+    """Copy numeric range constraints"""
+    if "minimum" in prop_def:
+        schema["minimum"] = prop_def["minimum"]
+    if "maximum" in prop_def:
+        schema["maximum"] = prop_def["maximum"]
+
+
+def _apply_array(
+    schema: Dict[str, Any], prop_def: Dict[str, Any], generator: "JSONSchemaGenerator"
+) -> None:
+    """Generate the schema for array items"""
+    if "items" in prop_def:
+        schema["items"] = generator._generate_property_schema(prop_def["items"])
+
+
+def _apply_object(
+    schema: Dict[str, Any], prop_def: Dict[str, Any], generator: "JSONSchemaGenerator"
+) -> None:
+    """Generate schemas for nested object properties"""
+    if "properties" in prop_def:
+        schema["properties"] = {
+            nested_name: generator._generate_property_schema(nested_def)
+            for nested_name, nested_def in prop_def["properties"].items()
+        }
+
+
+# Type-specific handlers applied by _process_property_dict, keyed by normalized type
+_CONSTRAINT_HANDLERS = {
+    "string": _apply_string_constraints,
+    "integer": _apply_numeric_constraints,
+    "number": _apply_numeric_constraints,
+    "array": _apply_array,
+    "object": _apply_object
+}
+
 
 class JSONSchemaGenerator:
     """Generates JSON schemas for tool input validation"""
     
-    def __init__(self):
-        self.type_mapping = {
-            "str": "string",
-            "string": "string",
-            "int": "integer",
-            "integer": "integer",
-            "float": "number",
-            "number": "number",
-            "bool": "boolean",
-            "boolean": "boolean",
-            "list": "array",
-            "array": "array",
-            "dict": "object",
-            "object": "object"
-        }
+    __slots__ = ()
     
     def generate_schema(self, properties: Dict[str, Any], required: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -37,16 +105,18 @@ class JSONSchemaGenerator:
         Returns:
             Complete JSON schema dictionary
         """
-        schema = {
+        # Plain dict definitions are the common case and skip the generic dispatcher
+        process_dict = self._process_property_dict
+        generate = self._generate_property_schema
+        
+        return {
             "type": "object",
-            "properties": {},
+            "properties": {
+                prop_name: process_dict(prop_def) if isinstance(prop_def, dict) else generate(prop_def)
+                for prop_name, prop_def in properties.items()
+            },
             "required": required or []
         }
-        
-        for prop_name, prop_def in properties.items():
-            schema["properties"][prop_name] = self._generate_property_schema(prop_def)
-        
-        return schema
     
     def _generate_property_schema(self, prop_def: Any) -> Dict[str, Any]:
         """Generate schema for a single property"""
@@ -73,38 +143,18 @@ class JSONSchemaGenerator:
             schema["description"] = str(prop_def["description"])
         
         # Handle enum values
-        if "enum" in prop_def and isinstance(prop_def["enum"], list):
-            schema["enum"] = prop_def["enum"]
+        enum_values = prop_def.get("enum")
+        if isinstance(enum_values, list):
+            schema["enum"] = enum_values
         
         # Handle default values
         if "default" in prop_def:
             schema["default"] = prop_def["default"]
         
-        # Handle array items
-        if schema["type"] == "array" and "items" in prop_def:
-            schema["items"] = self._generate_property_schema(prop_def["items"])
-        
-        # Handle object properties
-        if schema["type"] == "object" and "properties" in prop_def:
-            schema["properties"] = {}
-            for nested_name, nested_def in prop_def["properties"].items():
-                schema["properties"][nested_name] = self._generate_property_schema(nested_def)
-        
-        # Handle string constraints
-        if schema["type"] == "string":
-            if "minLength" in prop_def:
-                schema["minLength"] = int(prop_def["minLength"])
-            if "maxLength" in prop_def:
-                schema["maxLength"] = int(prop_def["maxLength"])
-            if "pattern" in prop_def:
-                schema["pattern"] = str(prop_def["pattern"])
-        
-        # Handle number constraints
-        if schema["type"] in ["integer", "number"]:
-            if "minimum" in prop_def:
-                schema["minimum"] = prop_def["minimum"]
-            if "maximum" in prop_def:
-                schema["maximum"] = prop_def["maximum"]
+        # Apply type-specific constraints
+        handler = _CONSTRAINT_HANDLERS.get(schema["type"])
+        if handler:
+            handler(schema, prop_def, self)
         
         return schema
     
@@ -115,22 +165,18 @@ class JSONSchemaGenerator:
         else:
             type_str = str(type_value).lower()
         
-        return self.type_mapping.get(type_str, "string")
+        return _TYPE_MAPPING.get(type_str, "string")
     
     def _infer_type(self, value: Any) -> str:
         """Infer JSON schema type from Python value"""
-        if isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, int):
-            return "integer"
-        elif isinstance(value, float):
-            return "number"
-        elif isinstance(value, list):
-            return "array"
-        elif isinstance(value, dict):
-            return "object"
-        else:
-            return "string"
+        json_type = _PY_TO_JSON.get(type(value))
+        if json_type is None:
+            # Subclasses of the mapped types (e.g. OrderedDict) need isinstance checks
+            json_type = next(
+                (mapped for py_type, mapped in _PY_TO_JSON.items() if isinstance(value, py_type)),
+                "string"
+            )
+        return json_type
     
     def validate_schema(self, schema: Dict[str, Any]) -> bool:
         """
@@ -142,37 +188,31 @@ class JSONSchemaGenerator:
         Returns:
             True if schema is valid, False otherwise
         """
-        try:
-            # Basic validation checks
-            if not isinstance(schema, dict):
-                return False
+        # Walk nested schemas with an explicit stack; shared sub-schemas are checked once
+        seen = set()
+        pending = [schema]
+        while pending:
+            current = pending.pop()
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
             
-            if "type" not in schema:
+            # Basic validation checks
+            if not isinstance(current, dict):
                 return False
             
-            valid_types = ["string", "integer", "number", "boolean", "array", "object", "null"]
-            if schema["type"] not in valid_types:
+            schema_type = current.get("type")
+            if not isinstance(schema_type, str) or schema_type not in _VALID_TYPES:
                 return False
             
-            # Validate properties if object type
-            if schema["type"] == "object":
-                if "properties" in schema:
-                    if not isinstance(schema["properties"], dict):
-                        return False
-                    
-                    # Recursively validate nested properties
-                    for prop_schema in schema["properties"].values():
-                        if not self.validate_schema(prop_schema):
-                            return False
+            # Queue nested properties if object type
+            if schema_type == "object" and "properties" in current:
+                if not isinstance(current["properties"], dict):
+                    return False
+                pending.extend(current["properties"].values())
             
-            # Validate array items
-            if schema["type"] == "array":
-                if "items" in schema:
-                    if not self.validate_schema(schema["items"]):
-                        return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Schema validation error: {str(e)}")
-            return False
\ No newline at end of file
+            # Queue array items
+            if schema_type == "array" and "items" in current:
+                pending.append(current["items"])
+        
+        return True
\ No newline at end of file
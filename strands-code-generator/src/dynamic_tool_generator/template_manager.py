@@ -1,34 +1,94 @@
 """
 Template manager for different tool types
 """
-from typing import Dict, Any
+import json
+import string
+from functools import lru_cache
+from typing import Dict, Any, Callable
 from ..models.tool_spec import ToolType
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same layout
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _compile_renderer(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format-style template into a function that returns it as an f-string
+    
+    Rendering then runs the interpreter's BUILD_STRING path instead of re-parsing the
+    template on every str.format call. Template escapes ({{ and }}) mean the same
+    thing in an f-string, so the template source is reused verbatim.
+    
+    Args:
+        template: Template using {field_name} placeholders
+        
+    Returns:
+        Function taking the template variables as keyword arguments
+    """
+    # Cached by template text, so every manager instance shares the compiled renderers
+    field_names = []
+    for _, field_name, _, _ in string.Formatter().parse(template):
+        if field_name is None or field_name in field_names:
+            continue
+        if not field_name.isidentifier():
+            raise ValueError(f"Unsupported template field: {field_name!r}")
+        field_names.append(field_name)
+    
+    params = ', '.join(['*', *field_names, '**_unused'] if field_names else ['**_unused'])
+    source = f"def _render({params}):\n    return f{template!r}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<tool_template>', 'exec'), namespace)
+    return namespace['_render']
+
 
 class ToolTemplateManager:
     """Manages templates for different tool types"""
     
+    # Template-producing methods per tool type; templates are built on first use
+    _TEMPLATE_BUILDERS = {
+        ToolType.FRONTEND_ACTION: "_get_frontend_action_template",
+        ToolType.CODE_EXECUTION: "_get_code_execution_template",
+        ToolType.AGENT_TOOL: "_get_agent_tool_template"
+    }
+    
     def __init__(self):
         self._templates = {}
-        self._load_templates()
-    
-    def _load_templates(self):
-        """Load all tool templates"""
-        self._templates[ToolType.FRONTEND_ACTION] = self._get_frontend_action_template()
-        self._templates[ToolType.CODE_EXECUTION] = self._get_code_execution_template()
-        self._templates[ToolType.AGENT_TOOL] = self._get_agent_tool_template()
-        self._templates[ToolType.AGENT_TOOL] = self._get_agent_tool_template()
     
     def get_template(self, tool_type: ToolType) -> str:
         """Get template for specified tool type"""
         template = self._templates.get(tool_type)
-        if not template:
-            raise ValueError(f"No template found for tool type: {tool_type}")
+        if template is None:
+            builder = self._TEMPLATE_BUILDERS.get(tool_type)
+            if builder is None:
+                raise ValueError(f"No template found for tool type: {tool_type}")
+            template = self._templates[tool_type] = getattr(self, builder)()
         return template
     
+    def render(self, tool_type: ToolType, template_vars: Dict[str, Any]) -> str:
+        """Render the template for the specified tool type with the given variables"""
+        return self.render_source(self.get_template(tool_type), template_vars)
+    
+    @staticmethod
+    def render_source(template: str, template_vars: Dict[str, Any]) -> str:
+        """Render any str.format-style template through the shared compiled-renderer cache"""
+        return _compile_renderer(template)(**template_vars)
+    
+    @staticmethod
+    def dumps(obj: Any) -> str:
+        """Serialize obj as 2-space indented, key-sorted JSON for embedding in templates"""
+        if orjson is not None:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False)
+    
     def get_available_types(self) -> list:
         """Get list of available tool types"""
-        return list(self._templates.keys())
+        return list(self._TEMPLATE_BUILDERS.keys())
     
     def _get_frontend_action_template(self) -> str:
         """Template for frontend action tools"""
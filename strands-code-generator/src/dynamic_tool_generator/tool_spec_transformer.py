@@ -1,22 +1,50 @@
 """
 Tool specification transformer - converts standardized frontend data into tool specifications
 """
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import copy
+import hashlib
+import json
 import logging
+import re
+import sys
+import threading
 
 from ..models.tool_spec import ToolSpecification, ToolInputSchema, ToolType
 
 logger = logging.getLogger(__name__)
 
+# Runs of characters that collapse to a single underscore in function names; a
+# single scan matches replacing [^a-zA-Z0-9_] with '_' and then collapsing '_+'
+_NON_ALNUM_RUNS = re.compile(r'[^a-zA-Z0-9]+')
+
+# LRU cache of transformed specs keyed by a digest of the canonical frontend data
+_SPEC_CACHE: "OrderedDict[bytes, ToolSpecification]" = OrderedDict()
+_SPEC_CACHE_SIZE = 1024
+_SPEC_CACHE_LOCK = threading.Lock()
+
+
+def _spec_cache_key(frontend_data: Dict[str, Any]) -> Optional[bytes]:
+    """Digest of the canonical JSON form of frontend data, or None if not serializable"""
+    try:
+        canonical = json.dumps(frontend_data, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
 
 class ToolSpecTransformer:
     """Transforms standardized frontend data into tool specifications"""
     
+    __slots__ = ("supported_types",)
+    
     def __init__(self):
+        # Interned keys let lookups with interned type strings match by identity
         self.supported_types = {
-            "frontend_action": ToolType.FRONTEND_ACTION,
-            "code_execution": ToolType.CODE_EXECUTION,
-            "agent_tool": ToolType.AGENT_TOOL
+            sys.intern("frontend_action"): ToolType.FRONTEND_ACTION,
+            sys.intern("code_execution"): ToolType.CODE_EXECUTION,
+            sys.intern("agent_tool"): ToolType.AGENT_TOOL
         }
     
     def transform_frontend_data(self, frontend_data: Dict[str, Any]) -> ToolSpecification:
@@ -44,53 +72,87 @@ class ToolSpecTransformer:
         Raises:
             ValueError: If required fields are missing or invalid
         """
+        # Repeated submissions of the same spec (e.g. hot reloads) reuse the cached result
+        cache_key = _spec_cache_key(frontend_data)
+        cached_spec = None
+        if cache_key is not None:
+            with _SPEC_CACHE_LOCK:
+                cached_spec = _SPEC_CACHE.get(cache_key)
+                if cached_spec is not None:
+                    _SPEC_CACHE.move_to_end(cache_key)
+        if cached_spec is not None:
+            logger.debug(f"Using cached tool spec: {cached_spec.name}")
+            # Specs hold mutable dicts, so each caller gets its own copy of the cached one
+            return copy.deepcopy(cached_spec)
+        
         try:
-            self._validate_frontend_data(frontend_data)
-            
-            # Extract required fields
-            name = self._sanitize_function_name(frontend_data["name"])
-            description = frontend_data["description"]
-            tool_type = self.supported_types[frontend_data["type"]]
+            raw_name, description, tool_type = self._validate_frontend_data(frontend_data)
             
             # Parse input schema
             input_schema = self._parse_input_schema(frontend_data.get("inputSchema", {}))
-            
-            # Create tool specification
-            tool_spec = ToolSpecification(
-                name=name,
-                description=description,
-                tool_type=tool_type,
-                input_schema=input_schema,
-                frontend_data=frontend_data
-            )
-            
-            logger.info(f"Successfully transformed frontend data into tool spec: {name}")
-            return tool_spec
-            
-        except Exception as e:
+        except ValueError as e:
             logger.error(f"Failed to transform frontend data: {str(e)}")
-            raise ValueError(f"Invalid frontend data structure: {str(e)}")
+            raise
+        
+        name = self._sanitize_function_name(raw_name)
+        
+        # Create tool specification
+        tool_spec = ToolSpecification(
+            name=name,
+            description=description,
+            tool_type=tool_type,
+            input_schema=input_schema,
+            frontend_data=frontend_data
+        )
+        
+        if cache_key is not None:
+            # Cache a private copy; the caller's spec shares dicts with its frontend data
+            with _SPEC_CACHE_LOCK:
+                _SPEC_CACHE[cache_key] = copy.deepcopy(tool_spec)
+                if len(_SPEC_CACHE) > _SPEC_CACHE_SIZE:
+                    _SPEC_CACHE.popitem(last=False)
+        
+        logger.info(f"Successfully transformed frontend data into tool spec: {name}")
+        return tool_spec
     
-    def _validate_frontend_data(self, data: Dict[str, Any]) -> None:
-        """Validate that frontend data has required fields in correct format"""
-        required_fields = ["name", "description", "type"]
-        
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Required field '{field}' missing from frontend data")
-            if not data[field] or not str(data[field]).strip():
+    def _validate_frontend_data(self, data: Dict[str, Any]) -> Tuple[str, str, ToolType]:
+        """
+        Validate that frontend data has required fields in correct format
+        
+        Returns:
+            Tuple of the raw name, description and resolved tool type
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Frontend data must be a dictionary")
+        
+        name = data.get("name")
+        description = data.get("description")
+        type_value = data.get("type")
+        
+        for field, value in (("name", name), ("description", description), ("type", type_value)):
+            if not value or not str(value).strip():
+                if field not in data:
+                    raise ValueError(f"Required field '{field}' missing from frontend data")
                 raise ValueError(f"Required field '{field}' cannot be empty")
         
+        # The name is sanitized and the type looked up below, so both must be strings
+        for field, value in (("name", name), ("type", type_value)):
+            if not isinstance(value, str):
+                raise ValueError(f"Field '{field}' must be a string")
+        
         # Validate tool type
-        tool_type = data["type"]
-        if tool_type not in self.supported_types:
+        type_value = sys.intern(type_value)
+        tool_type = self.supported_types.get(type_value)
+        if tool_type is None:
             supported = list(self.supported_types.keys())
-            raise ValueError(f"Unsupported tool type '{tool_type}'. Supported types: {supported}")
+            raise ValueError(f"Unsupported tool type '{type_value}'. Supported types: {supported}")
         
         # Validate input schema if present
         if "inputSchema" in data and data["inputSchema"]:
             if not isinstance(data["inputSchema"], dict):
                 raise ValueError("inputSchema must be a dictionary")
+        
+        return name, description, tool_type
     
     def _parse_input_schema(self, schema_data: Dict[str, Any]) -> ToolInputSchema:
         """Parse input schema from standardized format"""
@@ -117,24 +179,16 @@ class ToolSpecTransformer:
     
     def _sanitize_function_name(self, name: str) -> str:
         """Sanitize name for use as Python function name"""
-        import re
-        
-        # Replace non-alphanumeric characters with underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        
-        # Ensure it starts with a letter or underscore
-        if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
-            sanitized = f"tool_{sanitized}"
-        
-        # Remove consecutive underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
-        
-        # Remove trailing underscores
-        sanitized = sanitized.strip('_')
+        # Replace non-alphanumeric runs with one underscore and trim the ends
+        sanitized = _NON_ALNUM_RUNS.sub('_', name).strip('_')
         
         # Ensure it's not empty
         if not sanitized:
-            sanitized = "generated_tool"
+            return "generated_tool"
+        
+        # Ensure it starts with a letter
+        if not sanitized[0].isalpha():
+            sanitized = f"tool_{sanitized}"
         
         return sanitized  
   
@@ -4,13 +4,20 @@ Processes frontend configuration data and generates AWS deployment packages
 """
 import json
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser/encoder
+    orjson = None
 
 from .config.settings import settings
-from .dynamic_tool_generator.engine import DynamicToolGenerationEngine
-from .deployment.package_generator import DeploymentPackageGenerator
+from .models.tool_spec import ToolSpecification
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +27,79 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Config files above this size are stream-parsed when ijson is installed
+_STREAMING_THRESHOLD_BYTES = 1024 * 1024
+
+# Top-level configuration sections used by process_frontend_configuration
+_CONFIG_SECTIONS = frozenset({"agents", "tools", "main_agent", "environment"})
+
+# Worker cap for generating tool and agent files; the work is mostly file I/O
+_MAX_GENERATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Conversation policy appended to every generated agent's system prompt
+_AGENT_PROMPT_SUFFIX = """Do not use the speak_to_user and ask_user tool together, use only one of them, use ask_user if both were to be used, as using both will cause latency issues if used at the same time or one after the other immediately. After speech is done, do not speak again and again, the user will say something if required. Only ask_user means a response is mandatory. You communicate with the user only through conversation.
+When the user indicates they are done, says no help is needed, or the goal has been completed,
+END the conversation gracefully and STOP responding.
+
+After saying a polite closing line once (if needed), do not speak again or repeat yourself. Just stop and end the turn (stop reason)
+Never continue saying goodbye or asking if more help is needed repeatedly.
+Do not reinitiate conversation after the user says goodbye, thanks, or declines further help. End the turn and STOP responding immediately.
+"""
+
+
+@lru_cache(maxsize=256)
+def _build_imports_block(tools: Tuple[str, ...]) -> str:
+    """Import lines for an agent's tools; agents sharing a tool set reuse the block"""
+    return "\n".join(f"from src.tools.{tool} import {tool}" for tool in tools)
+
+
+# Flags for truncating writes of generated files; O_BINARY only exists on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: str, content: bytes) -> None:
+    """Write content to path with raw os-level writes, bypassing the io buffering layers"""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Source of generated agent modules, compiled into a renderer on first use
+_AGENT_TEMPLATE = '''# {agent_name}.py
+from strands import Agent, tool
+from strands_tools import retrieve, http_request
+{tool_imports}
+
+@tool
+def {agent_name}(query: str) -> str:
+    """
+    {agent_title} agent
+    
+    Args:
+        query: User query or request
+        
+    Returns:
+        Agent response as string
+    """
+    agent = Agent(
+        system_prompt="""{system_prompt}""",
+        tools=[retrieve, http_request{tools_suffix}]
+    )
+    response = agent(query)
+    return str(response)
+'''
+
+
+def _render_agent_template(**template_vars: str) -> str:
+    """Render _AGENT_TEMPLATE with the shared compiled-renderer cache"""
+    # Import here so CLI paths that never render agents skip the generator package
+    from .dynamic_tool_generator.template_manager import ToolTemplateManager
+    return ToolTemplateManager.render_source(_AGENT_TEMPLATE, template_vars)
+
 
 class DynamicStrandsService:
     """Main service for processing frontend data and generating deployments"""
@@ -28,6 +108,7 @@ class DynamicStrandsService:
         """Initialize the service"""
         from .dynamic_tool_generator.tool_spec_transformer import ToolSpecTransformer
         from .dynamic_tool_generator.module_generator import PythonModuleGenerator
+        from .deployment.package_generator import DeploymentPackageGenerator
         
         self.transformer = ToolSpecTransformer()
         self.generator = PythonModuleGenerator()
@@ -57,21 +138,19 @@ class DynamicStrandsService:
             Path("generated/agents").mkdir(parents=True, exist_ok=True)
             Path("generated/tools").mkdir(parents=True, exist_ok=True)
             
-            # Generate tools from frontend specifications
-            logger.info(f"Generating {len(tools_config)} tools...")
-            generated_tools = []
-            for tool_spec in tools_config:
-                tool_name = self._generate_tool_file(tool_spec)
-                generated_tools.append(tool_name)
-                logger.debug(f"Generated tool: {tool_name}")
+            # Transform tool specs up front so every output file name is known before writing
+            tool_specifications = [self._transform_tool_spec(spec) for spec in tools_config]
+            generated_tools = [spec.name for spec in tool_specifications]
+            generated_agents = [spec.get("name", "unknown_agent") for spec in agents_config]
             
-            # Generate agents from frontend specifications  
-            logger.info(f"Generating {len(agents_config)} agents...")
-            generated_agents = []
-            for agent_spec in agents_config:
-                agent_name = self._generate_agent_file(agent_spec)
-                generated_agents.append(agent_name)
-                logger.debug(f"Generated agent: {agent_name}")
+            # Generate tools and agents from frontend specifications in one pass; specs are
+            # keyed by output name so each file is written once, the last spec winning on
+            # repeated names as with sequential writes
+            logger.info("Generating %d tools and %d agents...", len(tools_config), len(agents_config))
+            self._generate_files(
+                (self._generate_tool_file, dict(zip(generated_tools, tool_specifications))),
+                (self._generate_agent_file, dict(zip(generated_agents, agents_config)))
+            )
             
             # Create deployment package
             logger.info("Creating deployment package...")
@@ -82,13 +161,33 @@ class DynamicStrandsService:
                 environment_vars=environment_vars
             )
             
-            logger.info(f"Successfully created deployment package: {deployment_path}")
+            logger.info("Successfully created deployment package: %s", deployment_path)
             return str(deployment_path)
             
         except Exception as e:
             logger.error(f"Failed to process configuration: {str(e)}")
             raise
     
+    def _generate_files(self, *jobs: Tuple[Callable[[Any], str], Dict[str, Any]]) -> None:
+        """
+        Run file generators over their specifications in one shared thread pool
+        
+        Args:
+            jobs: (generator, specs keyed by output name) pairs; keying by output name gives
+                every generated file a single writer
+        """
+        tasks = [(generate, spec) for generate, specs in jobs for spec in specs.values()]
+        if len(tasks) <= 1:
+            for generate, spec in tasks:
+                generate(spec)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_GENERATION_WORKERS, len(tasks))) as executor:
+            submit = executor.submit
+            futures = [submit(generate, spec) for generate, spec in tasks]
+            for future in as_completed(futures):
+                future.result()
+    
     def process_configuration_file(self, config_file_path: str) -> str:
         """
         Process configuration from a JSON file
@@ -100,10 +199,24 @@ class DynamicStrandsService:
             Path to generated deployment package
         """
         try:
-            logger.info(f"Loading configuration from: {config_file_path}")
+            logger.info("Loading configuration from: %s", config_file_path)
+            
+            config_data = None
+            if os.path.getsize(config_file_path) > _STREAMING_THRESHOLD_BYTES:
+                config_data = self._load_configuration_streaming(config_file_path)
             
-            with open(config_file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            if config_data is None:
+                with open(config_file_path, 'rb') as f:
+                    raw_config = f.read()
+                if orjson is not None:
+                    try:
+                        config_data = orjson.loads(raw_config)
+                    except orjson.JSONDecodeError:
+                        # orjson rejects NaN/Infinity and very large integers; the stdlib
+                        # parser accepts those and reports any real syntax error
+                        config_data = json.loads(raw_config)
+                else:
+                    config_data = json.loads(raw_config)
             
             return self.process_frontend_configuration(config_data)
             
@@ -114,6 +227,43 @@ class DynamicStrandsService:
             logger.error(f"Invalid JSON in configuration file: {e}")
             raise
     
+    def _load_configuration_streaming(self, config_file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Stream-parse a large configuration file, keeping only the sections that are used
+        
+        Each top-level value is built and dropped in turn, so peak memory is bounded by
+        the largest section rather than the whole document.
+        
+        Args:
+            config_file_path: Path to JSON configuration file
+            
+        Returns:
+            Configuration sections, or None if ijson is not installed
+            
+        Raises:
+            ValueError: If the top-level JSON value is not an object
+        """
+        try:
+            import ijson
+        except ImportError:
+            return None
+        
+        logger.debug("Stream-parsing large configuration: %s", config_file_path)
+        try:
+            with open(config_file_path, 'rb') as f:
+                # kvitems yields nothing for a non-object root, which would pass as an empty config
+                _, first_event, _ = next(ijson.parse(f), (None, None, None))
+                if first_event != 'start_map':
+                    raise ValueError("Configuration file must contain a JSON object at the top level")
+                f.seek(0)
+                return {
+                    key: value
+                    for key, value in ijson.kvitems(f, '', use_float=True)
+                    if key in _CONFIG_SECTIONS
+                }
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    
     def generate_sample_configuration(self, output_path: str = "sample_config.json") -> None:
         """Generate a sample configuration file for reference"""
         sample_config = {
@@ -176,50 +326,51 @@ class DynamicStrandsService:
             }
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(sample_config, f, indent=2)
+        if orjson is not None:
+            sample_content = orjson.dumps(sample_config, option=orjson.OPT_INDENT_2)
+        else:
+            sample_content = json.dumps(sample_config, indent=2).encode('utf-8')
+        
+        Path(output_path).write_bytes(sample_content)
         
-        logger.info(f"Generated sample configuration: {output_path}")
+        logger.info("Generated sample configuration: %s", output_path)
     
-    def _generate_tool_file(self, tool_spec: Dict[str, Any]) -> str:
-        """Generate a tool file from frontend specification"""
+    def _transform_tool_spec(self, tool_spec: Dict[str, Any]) -> ToolSpecification:
+        """Transform a frontend tool specification into a tool specification"""
+        try:
+            return self.transformer.transform_frontend_data(tool_spec)
+        except Exception as e:
+            logger.error(f"Failed to generate tool {tool_spec.get('name', 'unknown')}: {e}")
+            raise
+    
+    def _generate_tool_file(self, tool_specification: ToolSpecification) -> str:
+        """Generate a tool file from a transformed tool specification"""
         try:
-            # Transform frontend data to tool specification
-            tool_specification = self.transformer.transform_frontend_data(tool_spec)
-            
             # Generate the module file
             module_path = self.generator.generate_tool_module(tool_specification, "generated/tools")
             
-            logger.debug(f"Generated tool file: {module_path}")
+            logger.debug("Generated tool file: %s", module_path)
             return tool_specification.name
             
         except Exception as e:
-            logger.error(f"Failed to generate tool {tool_spec.get('name', 'unknown')}: {e}")
+            logger.error(f"Failed to generate tool {tool_specification.name}: {e}")
             raise
     
     def _generate_agent_file(self, agent_spec: Dict[str, Any]) -> str:
         """Generate an agent file from frontend specification"""
         try:
             agent_name = agent_spec.get("name", "unknown_agent")
-            system_prompt = agent_spec.get("system_prompt", f"You are a {agent_name} agent.") + """Do not use the speak_to_user and ask_user tool together, use only one of them, use ask_user if both were to be used, as using both will cause latency issues if used at the same time or one after the other immediately. After speech is done, do not speak again and again, the user will say something if required. Only ask_user means a response is mandatory. You communicate with the user only through conversation.
-When the user indicates they are done, says no help is needed, or the goal has been completed,
-END the conversation gracefully and STOP responding.
-
-After saying a polite closing line once (if needed), do not speak again or repeat yourself. Just stop and end the turn (stop reason)
-Never continue saying goodbye or asking if more help is needed repeatedly.
-Do not reinitiate conversation after the user says goodbye, thanks, or declines further help. End the turn and STOP responding immediately.
-"""
+            system_prompt = agent_spec.get("system_prompt", f"You are a {agent_name} agent.") + _AGENT_PROMPT_SUFFIX
             tools = agent_spec.get("tools", [])
             
             # Create agent template
             agent_content = self._create_agent_template(agent_name, system_prompt, tools)
             
             # Write agent file
-            agent_file_path = Path("generated/agents") / f"{agent_name}.py"
-            with open(agent_file_path, 'w', encoding='utf-8') as f:
-                f.write(agent_content)
+            agent_file_path = f"generated/agents/{agent_name}.py"
+            _write_file(agent_file_path, agent_content.encode('utf-8'))
             
-            logger.debug(f"Generated agent file: {agent_file_path}")
+            logger.debug("Generated agent file: %s", agent_file_path)
             return agent_name
             
         except Exception as e:
@@ -229,39 +380,20 @@ Do not reinitiate conversation after the user says goodbye, thanks, or declines
     def _create_agent_template(self, agent_name: str, system_prompt: str, tools: List[str]) -> str:
         """Create agent template content"""
         
-        # Generate tool imports
-        tool_imports = []
-        for tool in tools:
-            tool_imports.append(f"from src.tools.{tool} import {tool}")
+        # Generate tool imports and the extra tools list entries; nothing to build without tools
+        if tools:
+            tool_imports = _build_imports_block(tuple(tools))
+            tools_suffix = ', ' + ", ".join(tools)
+        else:
+            tool_imports = tools_suffix = ''
         
-        # Generate tools list
-        tools_list = ", ".join(tools)
-        
-        agent_template = f'''# {agent_name}.py
-from strands import Agent, tool
-from strands_tools import retrieve, http_request
-{chr(10).join(tool_imports)}
-
-@tool
-def {agent_name}(query: str) -> str:
-    """
-    {agent_name.replace('_', ' ').title()} agent
-    
-    Args:
-        query: User query or request
-        
-    Returns:
-        Agent response as string
-    """
-    agent = Agent(
-        system_prompt="""{system_prompt}""",
-        tools=[retrieve, http_request{', ' + tools_list if tools else ''}]
-    )
-    response = agent(query)
-    return str(response)
-'''
-        
-        return agent_template
+        return _render_agent_template(
+            agent_name=agent_name,
+            agent_title=agent_name.replace('_', ' ').title(),
+            system_prompt=system_prompt,
+            tool_imports=tool_imports,
+            tools_suffix=tools_suffix
+        )
 
 
 def main():
@@ -273,13 +405,6 @@ def main():
         print("  python -m src.main --help              # Show this help")
         return
     
-    service = DynamicStrandsService()
-    
-    if sys.argv[1] == "--sample":
-        service.generate_sample_configuration()
-        print("Generated sample_config.json - edit this file with your configuration")
-        return
-    
     if sys.argv[1] == "--help":
         print("Dynamic Strands System - Generate AWS Agent Deployments")
         print("")
@@ -294,6 +419,13 @@ def main():
         print("  - environment: Environment variables")
         return
     
+    service = DynamicStrandsService()
+    
+    if sys.argv[1] == "--sample":
+        service.generate_sample_configuration()
+        print("Generated sample_config.json - edit this file with your configuration")
+        return
+    
     config_file = sys.argv[1]
     
     try:
@@ -1,7 +1,7 @@
 """
 Agent configuration data models
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 
 
@@ -22,11 +22,7 @@ class AgentConfig:
     system_prompt: str
     tools: List[str]  # List of tool names
     behavior_config: BehaviorConfig
-    metadata: Optional[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> 'AgentConfig':
@@ -45,5 +41,5 @@ class AgentConfig:
             system_prompt=data['system_prompt'],
             tools=data.get('tools', []),
             behavior_config=behavior_config,
-            metadata=data.get('metadata', {})
+            metadata=data.get('metadata') or {}
         )
\ No newline at end of file
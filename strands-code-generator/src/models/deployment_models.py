@@ -1,12 +1,12 @@
 """
 Deployment configuration data models
 """
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List
 from pathlib import Path
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class DeploymentConfig:
     """Configuration for AWS Agent Core Runtime deployment"""
     agent_name: str
@@ -14,14 +14,10 @@ class DeploymentConfig:
     tools_directory: str
     dependencies: List[str]
     environment_variables: Dict[str, str]
-    metadata: Optional[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class DeploymentPackage:
     """Deployment package information"""
     package_path: Path
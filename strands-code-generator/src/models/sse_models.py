@@ -4,10 +4,34 @@ SSE communication data models
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from datetime import datetime
+from time import gmtime, strftime, time
+import json
 import uuid
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+
+def _encode(value: Any) -> str:
+    """Compact JSON encoding of a single value"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the stdlib encoder handles
+            pass
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with microseconds, without building a datetime"""
+    now = time()
+    return f"{strftime('%Y-%m-%dT%H:%M:%S', gmtime(now))}.{int(now % 1 * 1e6):06d}"
+
+
+@dataclass(eq=False, repr=False)
 class SSESession:
     """SSE session information"""
     session_id: str
@@ -19,14 +43,14 @@ class SSESession:
     def create_new(cls, client_id: str) -> 'SSESession':
         """Create a new SSE session"""
         return cls(
-            session_id=str(uuid.uuid4()),
+            session_id=uuid.uuid4().hex,
             client_id=client_id,
             created_at=datetime.utcnow(),
             is_active=True
         )
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class SSEMessage:
     """SSE message structure"""
     type: str
@@ -40,23 +64,20 @@ class SSEMessage:
         return cls(
             type="frontend_action",
             session_id=session_id,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_utc_timestamp(),
             data=payload
         )
     
     def to_sse_format(self) -> str:
         """Convert to SSE format string"""
-        import json
-        message_data = {
-            "type": self.type,
-            "sessionId": self.session_id,
-            "timestamp": self.timestamp,
-            "data": self.data
-        }
-        return f"data: {json.dumps(message_data)}\n\n"
+        # Envelope is templated directly; only the field values go through the encoder
+        return (
+            f'data: {{"type":{_encode(self.type)},"sessionId":{_encode(self.session_id)},'
+            f'"timestamp":{_encode(self.timestamp)},"data":{_encode(self.data)}}}\n\n'
+        )
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class CallbackResponse:
     """HTTP callback response structure"""
     session_id: str
@@ -1,12 +1,13 @@
 """
 Tool specification data models
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Any, Optional, List, Union
 from enum import Enum
 
 
-class ToolType(Enum):
+class ToolType(str, Enum):
     """Types of tools that can be generated"""
     FRONTEND_ACTION = "frontend_action"
     CODE_EXECUTION = "code_execution"
@@ -18,19 +19,31 @@ class ToolType(Enum):
 class ToolInputSchema:
     """JSON schema for tool input validation"""
     type: str = "object"
-    properties: Dict[str, Any] = None
-    required: List[str] = None
+    properties: Dict[str, Any] = field(default_factory=dict)
+    required: List[str] = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.properties is None:
-            self.properties = {}
-        if self.required is None:
-            self.required = []
+    @cached_property
+    def wrapped(self) -> Dict[str, Any]:
+        """Schema in the {"json": {...}} registration form, built once per instance and shared"""
+        return {
+            "json": {
+                "type": self.type,
+                "properties": self.properties,
+                "required": self.required
+            }
+        }
+    
+    @cached_property
+    def json_str(self) -> str:
+        """Pretty-printed JSON of the schema, serialized once per instance"""
+        # Import here to avoid circular imports
+        from ..dynamic_tool_generator.template_manager import ToolTemplateManager
+        return ToolTemplateManager.dumps(self.wrapped["json"])
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolSpecification:
-    """Standardized tool specification"""
+    """Standardized tool specification (immutable, so it can be cached and shared)"""
     name: str
     description: str
     tool_type: ToolType
@@ -42,14 +55,15 @@ class ToolSpecification:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": {
-                "json": {
-                    "type": self.input_schema.type,
-                    "properties": self.input_schema.properties,
-                    "required": self.input_schema.required
-                }
-            }
+            "inputSchema": self.input_schema.wrapped
         }
+    
+    @cached_property
+    def json_str(self) -> str:
+        """Pretty-printed JSON of to_dict(), serialized once per instance"""
+        # Import here to avoid circular imports
+        from ..dynamic_tool_generator.template_manager import ToolTemplateManager
+        return ToolTemplateManager.dumps(self.to_dict())
 
 
 @dataclass
@@ -74,13 +88,7 @@ class AgentToolConfiguration:
             "name": self.name,
             "description": self.description,
             "system_prompt": self.system_prompt,
-            "inputSchema": {
-                "json": {
-                    "type": self.input_schema.type,
-                    "properties": self.input_schema.properties,
-                    "required": self.input_schema.required
-                }
-            },
+            "inputSchema": self.input_schema.wrapped,
             "tools": [
                 tool.to_dict() if isinstance(tool, ToolSpecification) 
                 else {"type": "builtin", "name": tool.name, "import": tool.import_module}
@@ -112,11 +120,5 @@ class AgentSpecification:
         return {
             "name": self.name,
             "description": self.description,
-            "inputSchema": {
-                "json": {
-                    "type": self.input_schema.type,
-                    "properties": self.input_schema.properties,
-                    "required": self.input_schema.required
-                }
-            }
+            "inputSchema": self.input_schema.wrapped
         }
\ No newline at end of file
@@ -2,22 +2,17 @@
 Pytest configuration and fixtures
 """
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests"""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+def temp_dir(tmp_path_factory):
+    """Create a temporary directory for tests (cleanup is left to pytest's retention policy)"""
+    return tmp_path_factory.mktemp("strands")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_spec():
-    """Sample tool specification for testing"""
+    """Sample tool specification for testing (shared across the session; copy before mutating)"""
     from src.models.tool_spec import ToolSpecification, ToolType, ToolInputSchema
     
     input_schema = ToolInputSchema(
@@ -36,9 +31,9 @@ def sample_tool_spec():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_agent_config():
-    """Sample agent configuration for testing"""
+    """Sample agent configuration for testing (shared across the session; copy before mutating)"""
     from src.models.agent_config import AgentConfig, BehaviorConfig
     
     behavior_config = BehaviorConfig(temperature=0.7)
@@ -0,0 +1,48 @@
+"""
+Tests for ToolSpecTransformer
+"""
+import copy
+
+from src.dynamic_tool_generator.tool_spec_transformer import ToolSpecTransformer
+
+
+FRONTEND_DATA = {
+    "name": "cache_check_tool",
+    "description": "Tool used to check spec cache isolation",
+    "type": "agent_tool",
+    "system_prompt": "Be nice",
+    "inputSchema": {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"]
+    }
+}
+
+
+class TestSpecCache:
+    """Cached specs must not share mutable state between callers"""
+    
+    def test_mutating_input_does_not_leak_into_cache(self):
+        transformer = ToolSpecTransformer()
+        data = copy.deepcopy(FRONTEND_DATA)
+        transformer.transform_frontend_data(data)
+        
+        data["system_prompt"] = "MUTATED"
+        data["inputSchema"]["properties"]["extra"] = {"type": "string"}
+        
+        spec = transformer.transform_frontend_data(copy.deepcopy(FRONTEND_DATA))
+        assert spec.frontend_data["system_prompt"] == "Be nice"
+        assert list(spec.input_schema.properties) == ["query"]
+    
+    def test_mutating_returned_spec_does_not_leak_into_cache(self):
+        transformer = ToolSpecTransformer()
+        first = transformer.transform_frontend_data(copy.deepcopy(FRONTEND_DATA))
+        first.frontend_data["system_prompt"] = "hacked"
+        first.input_schema.properties["extra"] = {"type": "string"}
+        first.input_schema.required.append("extra")
+        
+        second = transformer.transform_frontend_data(copy.deepcopy(FRONTEND_DATA))
+        assert second is not first
+        assert second.frontend_data["system_prompt"] == "Be nice"
+        assert list(second.input_schema.properties) == ["query"]
+        assert second.input_schema.required == ["query"]